@@ -1,64 +1,92 @@
+import os
+import functools
 import soundfile as sf
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Azure Speech reports durations in 100-nanosecond ticks (1s = 10^7 ticks)
+_TICKS_PER_SEC = 10000000.0
+
+@functools.lru_cache(maxsize=1024)
+def _duration_cached(audio_file_path, mtime_ns, size):
+    """
+    Read audio duration from the file header (memoized).
+
+    The (mtime_ns, size) key components are only there to invalidate stale
+    entries when a file is rewritten under the same path.
+    """
+    info = sf.info(audio_file_path)
+    return info.frames / info.samplerate
+
 def get_audio_duration(audio_file_path):
     """
     Get audio duration using soundfile (faster than librosa for metadata only).
-    
+
+    Results are memoized by (path, mtime, size) so repeated calls on the same
+    clip skip the file open and header parse.
+
     Args:
         audio_file_path: Path to audio file
-        
+
     Returns:
         float: Audio duration in seconds, or None if failed
     """
     try:
-        # Use soundfile to get audio info without loading the entire file
-        info = sf.info(audio_file_path)
-        duration = info.frames / info.samplerate
+        # Single stat to build the cache key; the header parse itself is memoized
+        st = os.stat(audio_file_path)
+        duration = _duration_cached(audio_file_path, st.st_mtime_ns, st.st_size)
         logger.debug(f" | Audio duration calculated using soundfile: {duration:.2f}s | ")
         return duration
     except Exception as e:
         logger.warning(f" | Failed to get audio duration using soundfile: {e} | ")
         return None
 
+def _rtf_fallback(audio_file_path, processing_time):
+    """
+    RTF fallback using the audio file itself when Azure provides no duration.
+
+    Args:
+        audio_file_path (str): Path to the audio file
+        processing_time (float): Time taken to process the audio
+
+    Returns:
+        float: Real Time Factor, 0.0 if the duration cannot be determined
+    """
+    try:
+        file_duration = get_audio_duration(audio_file_path)
+        if file_duration and file_duration > 0:
+            return processing_time / file_duration
+        return 0.0
+    except Exception as e:
+        logger.warning(f" | Could not calculate RTF: {e} | ")
+        return 0.0
+
 def calculate_rtf(result, audio_file_path, processing_time):
     """
     Calculate Real Time Factor (RTF) for speech processing.
-    
+
+    The common cases (timedelta or 100ns-tick duration from the SDK) are
+    handled inline without exception-handler setup; only the disk fallback
+    is guarded.
+
     Args:
         result: Azure Speech SDK result object containing duration information
         audio_file_path (str): Path to the audio file for fallback duration calculation
         processing_time (float): Time taken to process the audio
-        
+
     Returns:
         float: Real Time Factor (processing_time / audio_duration), 0.0 if calculation fails
     """
-    try:
-        # Handle Azure Speech duration units (100ns ticks)
-        azure_duration_seconds = 0
-        if isinstance(result.duration, int):
-            # Azure Speech returns duration in 100-nanosecond ticks
-            # 1 second = 10,000,000 ticks (10^7)
-            azure_duration_seconds = result.duration / 10000000.0
-        elif hasattr(result.duration, 'total_seconds'):
-            azure_duration_seconds = result.duration.total_seconds()
+    duration = getattr(result, 'duration', None)
+    if duration:
+        # Modern SDK versions report a timedelta; older ones raw 100ns ticks
+        if hasattr(duration, 'total_seconds'):
+            azure_duration_seconds = duration.total_seconds()
         else:
-            azure_duration_seconds = float(result.duration) if result.duration else 0
-        
-        # If Azure provides valid duration, use it
+            azure_duration_seconds = duration / _TICKS_PER_SEC
         if azure_duration_seconds > 0:
             return processing_time / azure_duration_seconds
-        
-        # Fallback to soundfile for audio duration if Azure doesn't provide it
-        file_duration = get_audio_duration(audio_file_path)
-        if file_duration and file_duration > 0:
-            return processing_time / file_duration
-        
-        # If both methods fail, return 0.0
-        return 0.0
-        
-    except Exception as e:
-        logger.warning(f" | Could not calculate RTF: {e} | ")
-        return 0.0
\ No newline at end of file
+
+    # Fallback to soundfile for audio duration if Azure doesn't provide it
+    return _rtf_fallback(audio_file_path, processing_time)
\ No newline at end of file
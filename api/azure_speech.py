@@ -1,57 +1,248 @@
-import os  
-import time  
+import os
+import re
+import time
 import json
-import logging  
+import wave
+import queue
+import atexit
+import logging
+import functools
+import requests
 import threading
 import logging.handlers
-import azure.cognitiveservices.speech as speechsdk
 
+from collections import deque, defaultdict, namedtuple, OrderedDict
 from lib.constant import DEFAULT_CONFIG, LANGUAGE_LIST, LANGUAGE_MATCH, LANGUAGE_MATCH_BACK, WAITING_TIME
 from api.audio_utils import calculate_rtf
   
-logger = logging.getLogger(__name__)  
-  
-# Configure logger settings (if not already configured)
-if not logger.handlers:  
-    log_format = "%(asctime)s - %(message)s"  
-    log_file = "logs/app.log"  
-    logging.basicConfig(level=logging.INFO, format=log_format)  
-  
-    # Create file handler with rotation (max 10MB per file, keep 5 backups)
-    file_handler = logging.handlers.RotatingFileHandler(  
-        log_file, maxBytes=10*1024*1024, backupCount=5  
-    )  
-    file_handler.setFormatter(logging.Formatter(log_format))  
-  
+logger = logging.getLogger(__name__)
+
+# The Azure Speech SDK loads native libraries and takes noticeable time to
+# import, so it is deferred until the first call that actually needs it.
+# Everything below references the module through this global, which _sdk()
+# rebinds on first use.
+speechsdk = None
+_sdk_lock = threading.Lock()
+
+def _sdk():
+    """
+    Import azure.cognitiveservices.speech on first use and return it.
+
+    Keeps module import (and anything that only needs key_test or the
+    config helpers) fast; double-checked locking makes the first load
+    safe under concurrent callers.
+    """
+    global speechsdk
+    if speechsdk is None:
+        with _sdk_lock:
+            if speechsdk is None:
+                import azure.cognitiveservices.speech as _speechsdk
+                speechsdk = _speechsdk
+    return speechsdk
+
+# Matches any CJK ideograph; used for fast Chinese-text detection
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+
+# Precompiled cleanup patterns for combining recognized segments
+_RE_CJK_SPACE = re.compile(r'(?<=[\u4e00-\u9fff])\s+(?=[\u4e00-\u9fff])')  # spaces between CJK chars
+_RE_CJK_PUNCT = re.compile(r'\s*([\uff0c\u3002\uff1f\uff01\uff1b\uff1a])\s*')  # spaces around CJK punctuation
+_RE_MULTISPACE = re.compile(r'\s+')
+
+def _clean_text(text):
+    """
+    Normalize spacing in combined recognition/translation text.
+
+    Removes spaces between CJK characters and around CJK punctuation, then
+    collapses any remaining runs of whitespace.
+    """
+    text = _RE_CJK_SPACE.sub('', text)
+    text = _RE_CJK_PUNCT.sub(r'\1', text)
+    return _RE_MULTISPACE.sub(' ', text).strip()
+
+# CJK punctuation that should never carry surrounding spaces
+_CJK_PUNCT_CHARS = frozenset('，。？！；：')
+
+def _is_cjk_char(char):
+    """Return True for CJK ideographs (same range as _CJK_RE)."""
+    return '\u4e00' <= char <= '\u9fff'
+
+def _join_segments(segments):
+    """
+    Combine recognized segments into one string in a single pass.
+
+    Instead of joining everything with spaces and then collapsing the result
+    with three regex passes over the full combined string, this walks the
+    segments once and inserts a boundary space only when neither side is CJK
+    text/punctuation. The compiled cleanup patterns still run, but only inside
+    segments that actually contain whitespace.
+    """
+    parts = []
+    for segment in segments:
+        segment = segment.strip()
+        if segment and (' ' in segment or '\t' in segment or '\n' in segment):
+            segment = _clean_text(segment)
+        if not segment:
+            continue
+        if parts:
+            prev_end = parts[-1][-1]
+            cur_start = segment[0]
+            # CJK punctuation never carries an adjacent space regardless of
+            # what sits on the other side (matching the old regex cleanup);
+            # between plain characters, drop the space only when both sides
+            # are CJK ideographs
+            if not (prev_end in _CJK_PUNCT_CHARS or cur_start in _CJK_PUNCT_CHARS or
+                    (_is_cjk_char(prev_end) and _is_cjk_char(cur_start))):
+                parts.append(' ')
+        parts.append(segment)
+    return ''.join(parts)
+
+# Candidate languages for automatic source-language detection
+_AUTO_DETECT_LANGS = ("zh-TW", "en-US", "de-DE")
+
+# 100ms of 16kHz 16-bit mono silence used by warmup's connection probe
+_SILENCE_100MS = bytes(1600)
+
+# Frames per read when streaming a WAV file to a push stream (~0.8s of
+# 16kHz audio per chunk, ~25KB for 16-bit mono)
+_STREAM_CHUNK_FRAMES = 3200 * 4
+
+# Stand-in for an SDK result when continuous recognition provides none;
+# calculate_rtf only looks at these two attributes
+_DummyResult = namedtuple("_DummyResult", ["duration", "text"])
+
+# Translation targets mapped through LANGUAGE_MATCH once at import time
+_TARGET_LANGS = tuple(LANGUAGE_MATCH.get(lang, lang) for lang in LANGUAGE_LIST)
+_ZH_HANT_NEEDED = any(lang in ('zh-Hant', 'zh-TW') for lang in _TARGET_LANGS)
+
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Marker attached to handlers installed by configure_logging, so reloads
+# (uvicorn --reload, repeated test imports) can't double-attach them
+_HANDLER_TAG = "azure_speech"
+
+def configure_logging():
+    """
+    Install the log handlers for this module (idempotent).
+
+    Handler setup opens the rotating log file, so it is deferred to the
+    application entrypoint instead of running as an import side effect
+    (imports stay cheap and test harnesses don't double-attach handlers).
+    Repeat calls are no-ops: handlers installed here carry a tag that is
+    checked before adding new ones, which prevents the doubled log lines
+    (and doubled disk writes) that reloads used to cause.
+
+    The logger itself only gets a QueueHandler, so request threads pay a
+    queue.put per record; the actual format + disk/console write happens on
+    a background QueueListener thread.
+    """
+    if any(getattr(handler, "_babelon_tag", None) == _HANDLER_TAG
+           for handler in logger.handlers):
+        return
+
+    log_format = "%(asctime)s - %(message)s"
+    log_file = "logs/app.log"
+    sink_handlers = []
+
+    try:
+        # Create file handler with rotation (max 10MB per file, keep 5 backups)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=10*1024*1024, backupCount=5
+        )
+        file_handler.setFormatter(logging.Formatter(log_format))
+        sink_handlers.append(file_handler)
+    except OSError as e:
+        # A missing/unwritable log directory should not brick the module;
+        # console logging below still works
+        logger.warning(f" | Could not open log file {log_file}: {e} | ")
+
     # Create console handler for real-time output
-    console_handler = logging.StreamHandler()  
-    console_handler.setFormatter(logging.Formatter(log_format))  
-  
-    logger.addHandler(file_handler)  
-    logger.addHandler(console_handler)  
-  
-logger.setLevel(logging.INFO)  
-logger.propagate = False  
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(log_format))
+    sink_handlers.append(console_handler)
+
+    # Hand records off to a background writer thread; the logging call on the
+    # request path then never blocks on disk
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler._babelon_tag = _HANDLER_TAG
+    logger.addHandler(queue_handler)
 
-##############################################################################  
+    listener = logging.handlers.QueueListener(
+        log_queue, *sink_handlers, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Flush pending records on shutdown
+
+##############################################################################
+
+@functools.lru_cache(maxsize=64)
+def _load_config(config_path, mtime_ns):
+    """
+    Parse a model config JSON file (memoized by path + mtime).
+
+    The mtime_ns key component invalidates the cache entry when the file
+    is rewritten, e.g. by upload_custom_model.
+    """
+    with open(config_path, 'r') as config_file:
+        return json.load(config_file)
+
+def _load_config_cached(config_path):
+    """
+    Load a model config dict, hitting the parse cache when the file is unchanged.
+
+    Args:
+        config_path (str): Path to the configuration JSON file
+
+    Returns:
+        dict: Parsed configuration
+
+    Raises:
+        FileNotFoundError: If the config file does not exist
+    """
+    mtime_ns = os.stat(config_path).st_mtime_ns
+    return _load_config(config_path, mtime_ns)
+
+##############################################################################
 
 class AzureSpeechModel:  
     """
     Azure Speech Service Model for speech recognition and translation.
-    
-    This class provides a delayed configuration architecture where Azure SDK 
-    objects are created dynamically during inference to ensure thread safety.
+
+    SDK config objects are cached per (credentials, language) and never
+    mutated after they are built, so concurrent requests can share them
+    safely; recognizers are still created per call during inference.
     """
-    
-    def __init__(self, config_path=DEFAULT_CONFIG):  
+
+    # Fixed attribute set: avoids the per-instance __dict__ and speeds up the
+    # attribute reads transcribe/translate do on every call
+    __slots__ = (
+        'model_version',
+        'subscription_key',
+        'service_region',
+        'endpoint_id',
+        'dict',
+        '_dict_stripped',
+        '_config_lock',
+        '_speech_config_cache',
+        '_translation_config_cache',
+        '_auto_detect_config',
+        '_transcribe_cache',
+        '_transcribe_cache_lock',
+    )
+
+    # Upper bound on remembered transcription results; oldest entries are
+    # evicted first once the cache is full
+    _TRANSCRIBE_CACHE_SIZE = 256
+
+    def __init__(self, config_path=DEFAULT_CONFIG):
         """
         Initialize the Model class with basic configuration attributes.
         
         Args:
             config_path (str): Path to the configuration JSON file
-        """  
-        with open(config_path, 'r') as config_file:
-            config = json.load(config_file)
+        """
+        config = _load_config_cached(config_path)
 
         # Store basic configuration that will be used to create SDK objects later
         self.model_version = config.get("name", None)
@@ -59,7 +250,184 @@ class AzureSpeechModel:
         self.service_region = config.get("ServiceRegion", None)
         self.endpoint_id = config.get("EndpointId", None)  # Custom model endpoint
         self.dict = []  # Custom vocabulary dictionary
-        
+        self._dict_stripped = ()  # Deduplicated, pre-stripped view of self.dict
+
+        # Cached SDK config objects keyed by (subscription_key, service_region, endpoint_id).
+        # Rebuilding SpeechConfig/SpeechTranslationConfig per request forces fresh TLS/WebSocket
+        # negotiation with Azure, so configs are built once and reused across calls.
+        self._config_lock = threading.Lock()
+        self._speech_config_cache = {}
+        self._translation_config_cache = {}
+
+        # Auto-detect config is immutable; built lazily on first use and then
+        # shared by every auto-detect request
+        self._auto_detect_config = None
+
+        # LRU cache of finished transcriptions keyed by (file identity,
+        # language, context); repeated submissions of the same clip skip the
+        # Azure round-trip entirely
+        self._transcribe_cache = OrderedDict()
+        self._transcribe_cache_lock = threading.Lock()
+
+    def _get_auto_detect_config(self):
+        """
+        Get the shared AutoDetectSourceLanguageConfig, creating it on first use.
+
+        Returns:
+            speechsdk.languageconfig.AutoDetectSourceLanguageConfig: Cached instance
+        """
+        if self._auto_detect_config is None:
+            _sdk()
+            self._auto_detect_config = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
+                languages=list(_AUTO_DETECT_LANGS))
+        return self._auto_detect_config
+
+    def _invalidate_config_cache(self):
+        """
+        Drop all cached SDK config objects (called when credentials change).
+        """
+        with self._config_lock:
+            self._speech_config_cache.clear()
+            self._translation_config_cache.clear()
+
+    def _transcribe_cache_key(self, audio_file_path, ori, prev_text):
+        """
+        Build the transcription cache key, or None if the file can't be stat'd.
+
+        File identity is the path plus (size, mtime): the stat components
+        invalidate a clip rewritten under the same name (the shared audio
+        buffer does this on every request), while the path keeps two distinct
+        files apart even when coarse mtime granularity and the fixed-size
+        chunks clients upload make their stat results collide.
+        """
+        try:
+            st = os.stat(audio_file_path)
+        except OSError:
+            return None
+        return (audio_file_path, st.st_size, st.st_mtime_ns, ori, prev_text, self._dict_stripped)
+
+    def _transcribe_cache_get(self, cache_key):
+        """
+        Look up a finished transcription, refreshing its LRU position on hit.
+        """
+        if cache_key is None:
+            return None
+        with self._transcribe_cache_lock:
+            cached = self._transcribe_cache.get(cache_key)
+            if cached is not None:
+                self._transcribe_cache.move_to_end(cache_key)
+            return cached
+
+    def _transcribe_cache_put(self, cache_key, value):
+        """
+        Remember a finished transcription, evicting the oldest entry when full.
+        """
+        if cache_key is None:
+            return
+        with self._transcribe_cache_lock:
+            self._transcribe_cache[cache_key] = value
+            self._transcribe_cache.move_to_end(cache_key)
+            if len(self._transcribe_cache) > self._TRANSCRIBE_CACHE_SIZE:
+                self._transcribe_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """
+        Drop all remembered transcription results.
+        """
+        with self._transcribe_cache_lock:
+            self._transcribe_cache.clear()
+
+    def _get_speech_config(self, language=None):
+        """
+        Get a cached SpeechConfig for the current credentials and language.
+
+        The config is built once per (subscription_key, service_region,
+        endpoint_id, language) and treated as immutable afterwards. Keying by
+        language is what makes sharing safe: concurrent requests for different
+        languages each get their own config instead of racing to mutate one.
+
+        Args:
+            language (str): Recognition language to bake into the config, or
+                None for a language-neutral config (auto-detect, warmup)
+
+        Returns:
+            speechsdk.SpeechConfig: Cached speech configuration instance
+        """
+        _sdk()
+        key = (self.subscription_key, self.service_region, self.endpoint_id, language)
+        with self._config_lock:
+            speech_config = self._speech_config_cache.get(key)
+            if speech_config is None:
+                speech_config = speechsdk.SpeechConfig(
+                    subscription=self.subscription_key,
+                    region=self.service_region
+                )
+
+                # Configure extended timeout settings for longer audio files
+                self._configure_timeout_settings(speech_config)
+
+                # Configure custom endpoint (if available)
+                if self.endpoint_id:
+                    speech_config.endpoint_id = self.endpoint_id
+                    logger.debug(" | Using custom model with endpoint_id: %s | ", self.endpoint_id)
+
+                if language:
+                    speech_config.speech_recognition_language = language
+
+                self._speech_config_cache[key] = speech_config
+        return speech_config
+
+    def _get_translation_config(self, language):
+        """
+        Get a cached SpeechTranslationConfig for the current credentials and
+        source language.
+
+        Target languages and timeout settings are applied once at build time so
+        repeated `translate` calls skip the per-request configuration
+        round-trips. The source language is part of the cache key and baked in
+        at build time, so the shared config is never mutated on the request
+        path and concurrent requests with different languages cannot race.
+
+        Args:
+            language (str): Source recognition language for the config
+
+        Returns:
+            speechsdk.translation.SpeechTranslationConfig: Cached translation configuration instance
+        """
+        _sdk()
+        key = (self.subscription_key, self.service_region, self.endpoint_id, language)
+        with self._config_lock:
+            translation_config = self._translation_config_cache.get(key)
+            if translation_config is None:
+                translation_config = speechsdk.translation.SpeechTranslationConfig(
+                    subscription=self.subscription_key,
+                    region=self.service_region
+                )
+
+                # Configure extended timeout settings for longer audio files
+                self._configure_timeout_settings(translation_config)
+
+                # Configure custom endpoint (if available)
+                if self.endpoint_id:
+                    translation_config.endpoint_id = self.endpoint_id
+                    logger.debug(" | Using custom model with endpoint_id: %s | ", self.endpoint_id)
+
+                translation_config.speech_recognition_language = language
+
+                # Configure target languages for translation (pre-mapped at import time)
+                for target_lang in _TARGET_LANGS:
+                    translation_config.add_target_language(target_lang)
+
+                # Special handling for Traditional Chinese variants
+                if _ZH_HANT_NEEDED:
+                    translation_config.set_property(
+                        property_id=speechsdk.PropertyId.SpeechServiceConnection_TranslationToLanguages,
+                        value="zh-Hant"
+                    )
+
+                self._translation_config_cache[key] = translation_config
+        return translation_config
+
     def change_custom_model(self, config_path):
         """
         Change the model configuration to a different Azure Speech model.
@@ -70,8 +438,7 @@ class AzureSpeechModel:
         Returns:
             bool: True if configuration change was successful, False otherwise
         """
-        with open(config_path, 'r') as config_file:
-            config = json.load(config_file)
+        config = _load_config_cached(config_path)
 
         new_version = config.get("name", None)
         new_subscription_key = config.get("SubscriptionKey", None)
@@ -85,6 +452,10 @@ class AzureSpeechModel:
             self.subscription_key = new_subscription_key
             self.service_region = new_service_region
             self.endpoint_id = new_endpoint_id
+            self._invalidate_config_cache()
+            # Cached transcripts came from the old model; drop them so a
+            # resubmitted clip is recognized by the new one
+            self.clear_cache()
             return True
         else:   
             logger.error(f" | Failed to change model configuration. Return to original version. | ")
@@ -98,28 +469,39 @@ class AzureSpeechModel:
             dictionary (list): List of custom words/phrases to enhance recognition
         """
         self.dict = dictionary
+        # Normalize once at update time so per-request setup skips the strip/filter
+        # work; dict.fromkeys dedupes while preserving the caller's phrase order
+        self._dict_stripped = tuple(dict.fromkeys(
+            word.strip() for word in dictionary if word and word.strip()))
         logger.info(f" | Updated dictionary with {len(self.dict)} entries. | ")
-        
+
     def _set_dict(self, prev_text, recognizer):
         """
         Configure phrase list grammar for improved speech recognition accuracy.
-        
+
         Args:
             prev_text (str): Previous text to add as context vocabulary
             recognizer: Azure Speech recognizer instance
         """
-        start_time = time.time()
-        words = list(self.dict)  
-        words.extend(prev_text)
-        
-        # Setup phrase list (if vocabulary exists)
+        start_time = time.perf_counter()
+        # Merge the pre-stripped dictionary with the request context, deduplicated
+        # in insertion order. When there is no context the cached tuple is used
+        # as-is (no copy).
+        if prev_text:
+            words = dict.fromkeys(self._dict_stripped)
+            words.update(dict.fromkeys(
+                word.strip() for word in prev_text if word and word.strip()))
+        else:
+            words = self._dict_stripped
+
+        # Setup phrase list (if vocabulary exists); each addPhrase crosses into the
+        # SDK, so duplicates and empty strings are filtered out before the loop
         if words:
             phrase_list = speechsdk.PhraseListGrammar.from_recognizer(recognizer)
             for word in words:
-                if word.strip():  # Ensure not empty string
-                    phrase_list.addPhrase(word.strip())
-            logger.debug(f" | Added {len(words)} phrases to recognition grammar | ")
-        logger.debug(f" | Setup PhraseList time: {time.time() - start_time:.2f} | ")
+                phrase_list.addPhrase(word)
+            logger.debug(" | Added %d phrases to recognition grammar | ", len(words))
+        logger.debug(" | Setup PhraseList time: %.2f | ", time.perf_counter() - start_time)
     
     def _configure_timeout_settings(self, config):
         """
@@ -201,12 +583,13 @@ class AzureSpeechModel:
                    For recognition: (combined_text, timeout_occurred)
         """
 
-        # Common variables
-        transcription_results = []
-        translation_results = {} if is_translation else None
-        recognition_done = False
-        timeout_occurred = False
-        
+        # Common variables. Results are appended from the SDK callback thread
+        # and read on this thread after completion; deque makes that hand-off
+        # explicitly thread-safe instead of relying on list-append atomicity.
+        transcription_results = deque()
+        translation_results = defaultdict(deque) if is_translation else None
+        done_event = threading.Event()  # Set by the SDK callbacks on completion
+
         def stop_recognizer_async(reason="unknown"):
             """
             Unified asynchronous method to stop the recognizer without blocking.
@@ -220,7 +603,7 @@ class AzureSpeechModel:
             def stop_worker():
                 try:
                     recognizer.stop_continuous_recognition()
-                    logger.debug(f" | {operation_name} recognizer stopped successfully ({reason}) | ")
+                    logger.debug(" | %s recognizer stopped successfully (%s) | ", operation_name, reason)
                 except Exception as e:
                     logger.error(f" | Failed to stop continuous {operation_name.lower()} ({reason}): {e} | ")
             
@@ -232,100 +615,65 @@ class AzureSpeechModel:
         def on_result_received(evt):
             if evt.result.text:
                 transcription_results.append(evt.result.text)
-                logger.debug(f" | {operation_name} segment: {evt.result.text} | ")
-                
+                # This callback fires once per recognized segment, so check the
+                # level once instead of paying a logging call per language below
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                if debug_enabled:
+                    logger.debug(" | %s segment: %s | ", operation_name, evt.result.text)
+
                 # Handle translation results if this is a translation operation
                 if is_translation and hasattr(evt.result, 'translations'):
                     for target_lang in evt.result.translations:
-                        if target_lang not in translation_results:
-                            translation_results[target_lang] = []
                         translation_results[target_lang].append(evt.result.translations[target_lang])
-                        logger.debug(f" | {target_lang}: {evt.result.translations[target_lang]} | ")
+                        if debug_enabled:
+                            logger.debug(" | %s: %s | ", target_lang, evt.result.translations[target_lang])
         
         def on_canceled(evt):
-            nonlocal recognition_done
-            recognition_done = True
-            logger.debug(f" | {operation_name} canceled: {evt.result.cancellation_details} | ")
-        
+            logger.debug(" | %s canceled: %s | ", operation_name, evt.result.cancellation_details)
+            done_event.set()
+
         def on_session_stopped(evt):
-            nonlocal recognition_done
-            recognition_done = True
-            logger.debug(f" | {operation_name} session stopped | ")
-        
-        def timeout_handler():
-            nonlocal timeout_occurred, recognition_done
-            time.sleep(WAITING_TIME)
-            if not recognition_done:
-                timeout_occurred = True
-                logger.warning(f" | {operation_name} has exceeded the upper limit time and has been stopped. | ")
-                stop_recognizer_async("timeout")
-        
+            logger.debug(" | %s session stopped | ", operation_name)
+            done_event.set()
+
         # Connect callbacks - handle both SpeechRecognizer and TranslationRecognizer
         recognizer.recognized.connect(on_result_received)
         recognizer.canceled.connect(on_canceled) 
         recognizer.session_stopped.connect(on_session_stopped)
         
-        # Optional: Connect recognizing event for intermediate results (mainly for TranslationRecognizer)
-        if hasattr(recognizer, 'recognizing') and is_translation:
-            recognizer.recognizing.connect(lambda evt: None)
-        
-        # Start timeout timer
-        timeout_thread = threading.Thread(target=timeout_handler)
-        timeout_thread.daemon = True
-        timeout_thread.start()
-        
-        try:
-            # Start continuous recognition
-            recognizer.start_continuous_recognition()
-            
-            # Wait for recognition to complete or timeout
-            while not recognition_done and not timeout_occurred:
-                time.sleep(0.1)
-                
-            # Stop recognition asynchronously to avoid blocking
-            stop_thread = stop_recognizer_async("normal completion")
-            
-            # Give the stop operation a moment to complete, but don't wait too long
-            stop_thread.join(timeout=2.0)  # Wait up to 2 seconds for graceful shutdown
-            
-        except Exception as e:
-            if timeout_occurred:
-                logger.info(f" | {operation_name} stopped due to timeout | ")
-            else:
-                raise e
-        
-        # Combine all results with intelligent spacing
-        if transcription_results:
-            # Join segments and clean up spacing
-            combined_text = " ".join(transcription_results).strip()
-            
-            # Clean up excessive spacing for Chinese text
-            import re
-            # Remove multiple spaces between Chinese characters
-            combined_text = re.sub(r'(?<=[\u4e00-\u9fff])\s+(?=[\u4e00-\u9fff])', '', combined_text)
-            # Remove spaces around Chinese punctuation
-            combined_text = re.sub(r'\s*([，。？！；：])\s*', r'\1', combined_text)
-            # Clean up any remaining multiple spaces
-            combined_text = re.sub(r'\s+', ' ', combined_text).strip()
-            
-            combined_transcription = combined_text
-        else:
-            combined_transcription = ""
-        
+
+        # Start continuous recognition without blocking on session start;
+        # the SDK establishes the connection while we wait on the event
+        recognizer.start_continuous_recognition_async()
+
+        # Wait for the completion callbacks or the upper limit time — the event
+        # wait gives timeout detection for free (no polling, no timer thread)
+        timeout_occurred = not done_event.wait(timeout=WAITING_TIME)
+        if timeout_occurred:
+            logger.warning(f" | {operation_name} has exceeded the upper limit time and has been stopped. | ")
+
+        # Stop recognition asynchronously to avoid blocking
+        stop_thread = stop_recognizer_async("timeout" if timeout_occurred else "normal completion")
+
+        # Give the stop operation a moment to complete, but don't wait too long
+        stop_thread.join(timeout=2.0)  # Wait up to 2 seconds for graceful shutdown
+
+        # Frequent "no speech detected" case: return immediately instead of
+        # running the combine work over empty result lists
+        if not transcription_results:
+            if is_translation:
+                return "", {}, timeout_occurred
+            return "", timeout_occurred
+
+        # Combine all results with intelligent spacing (single pass over segments)
+        combined_transcription = _join_segments(transcription_results)
+
         if is_translation:
             # Return translation format: (transcription, translations_dict, timeout)
             combined_translations = {}
             for target_lang, segments in translation_results.items():
                 # Join segments and clean up spacing for translations
-                joined_text = " ".join(segments).strip()
-                
-                # Clean up excessive spacing for Chinese text in translations
-                import re
-                joined_text = re.sub(r'(?<=[\u4e00-\u9fff])\s+(?=[\u4e00-\u9fff])', '', joined_text)
-                joined_text = re.sub(r'\s*([，。？！；：])\s*', r'\1', joined_text)
-                joined_text = re.sub(r'\s+', ' ', joined_text).strip()
-                
-                combined_translations[target_lang] = joined_text
+                combined_translations[target_lang] = _join_segments(segments)
             return combined_transcription, combined_translations, timeout_occurred
         else:
             # Return recognition format: (text, timeout)
@@ -348,49 +696,48 @@ class AzureSpeechModel:
                 - inference_time (float): Total processing time in seconds
                 - detected_language (str): Detected or specified language code
         """
-        start_time = time.time()
-        language = ori  
-        
+        start_time = time.perf_counter()
+        language = ori
+        # Map the requested language once; reused for config setup and the return value
+        mapped_language = LANGUAGE_MATCH.get(ori, ori) if ori and ori.strip() else None
+
+        # Serve repeated submissions of an identical clip from the local cache
+        cache_key = self._transcribe_cache_key(audio_file_path, ori, prev_text)
+        cached = self._transcribe_cache_get(cache_key)
+        if cached is not None:
+            cached_text, cached_rtf, cached_language = cached
+            logger.info(f" | Transcription cache hit for {audio_file_path} | ")
+            return cached_text, cached_rtf, time.perf_counter() - start_time, cached_language
+
         try:
-            # Create speech_config dynamically for thread safety
-            speech_config = speechsdk.SpeechConfig(
-                subscription=self.subscription_key,
-                region=self.service_region
-            )
-            
-            # Configure extended timeout settings for longer audio files
-            self._configure_timeout_settings(speech_config)
-            
-            # Configure custom endpoint (if available)
-            if self.endpoint_id:
-                speech_config.endpoint_id = self.endpoint_id
-                logger.debug(f" | Using custom model with endpoint_id: {self.endpoint_id} | ")
-            
+            _sdk()
+            # Reuse the cached speech config for the current credentials and
+            # language (configs are immutable once cached)
+            speech_config = self._get_speech_config(mapped_language)
+
             # Create audio configuration
             audio_config = speechsdk.audio.AudioConfig(filename=audio_file_path)
-            
+
             # Create recognizer based on language specification
-            if language is None or language.strip() == "":
-                # Enable automatic language detection
-                auto_detect_source_language_config = speechsdk.languageconfig.AutoDetectSourceLanguageConfig(
-                    languages=["zh-TW", "en-US", "de-DE"])
-                
+            if mapped_language is None:
+                # Enable automatic language detection (cached config)
+                auto_detect_source_language_config = self._get_auto_detect_config()
+
                 recognizer = speechsdk.SpeechRecognizer(
-                    speech_config=speech_config, 
+                    speech_config=speech_config,
                     auto_detect_source_language_config=auto_detect_source_language_config,
                     audio_config=audio_config
                 )
             else:
-                # Language matching and configuration for specified language
-                language = LANGUAGE_MATCH.get(language, language)
-                speech_config.speech_recognition_language = language
+                # Language is already baked into the cached config
+                language = mapped_language
 
                 recognizer = speechsdk.SpeechRecognizer(
                     speech_config=speech_config,
                     audio_config=audio_config
                 )
-                
-            logger.debug(f" | Recognizer created time: {time.time() - start_time:.2f} | ")
+
+            logger.debug(" | Recognizer created time: %.2f | ", time.perf_counter() - start_time)
             
             # Apply custom vocabulary and previous text context
             self._set_dict(prev_text, recognizer)
@@ -401,58 +748,180 @@ class AzureSpeechModel:
             transcription_text, timeout_occurred = self._continuous_recognition_with_timeout(recognizer, "Transcription", is_translation=False)
             
             if timeout_occurred:
-                return "", 0, time.time() - start_time, "unknown"
+                return "", 0, time.perf_counter() - start_time, "unknown"
             
             # Process recognition results
             if transcription_text:
-                logger.debug(f" | Transcription successful: {transcription_text} | ")
+                logger.debug(" | Transcription successful: %s | ", transcription_text)
             else:
                 logger.warning(f" | No speech could be recognized | ")
             
             # Calculate performance metrics
-            end_time = time.time()
+            end_time = time.perf_counter()
             inference_time = end_time - start_time
             
             # Calculate RTF (Real Time Factor) - use dummy result for continuous recognition
-            dummy_result = type('Result', (), {
-                'duration': None,
-                'text': transcription_text
-            })()
-            rtf = calculate_rtf(dummy_result, audio_file_path, inference_time)
+            rtf = calculate_rtf(_DummyResult(None, transcription_text), audio_file_path, inference_time)
 
             # Extract detected language from auto-detection results (only if auto-detection was used)
-            if ori is None or ori.strip() == "":
+            if mapped_language is None:
                 # For continuous recognition, we need to detect language from the text
                 logger.info(f" | No source language specified. Using text-based detection | ")
                 # Fallback: If we have text, detect language from content
                 if transcription_text:
-                    # Check if text contains Chinese characters
-                    has_chinese = any('\u4e00' <= char <= '\u9fff' for char in transcription_text)
+                    # Check if text contains Chinese characters (C-level scan, short-circuits)
+                    has_chinese = _CJK_RE.search(transcription_text) is not None
                     if has_chinese:
                         language = "zh-TW"
-                        logger.debug(f" | Detected Chinese characters, setting language to zh-TW | ")
+                        logger.debug(" | Detected Chinese characters, setting language to zh-TW | ")
                     else:
                         # Simple heuristic for other languages
                         language = "en-US"  # Default to English if no Chinese detected
-                        logger.debug(f" | No Chinese characters detected, defaulting to en-US | ")
+                        logger.debug(" | No Chinese characters detected, defaulting to en-US | ")
                 else:
                     language = "unknown"
             else:
                 # Specific language was provided, use the mapped language
-                language = LANGUAGE_MATCH.get(ori, ori)
-                logger.debug(f" | Used specified language: {language} (original: {ori}) | ")
+                language = mapped_language
+                logger.debug(" | Used specified language: %s (original: %s) | ", language, ori)
+
+            if transcription_text:
+                self._transcribe_cache_put(cache_key, (transcription_text, rtf, language))
 
             return transcription_text, rtf, inference_time, language
             
         except Exception as e:
             logger.error(f" | Transcription error: {e} | ")
-            return "", 0, time.time() - start_time, "unknown"
+            return "", 0, time.perf_counter() - start_time, "unknown"
+
+
+    def transcribe_stream(self, audio_file_path, ori, prev_text=""):
+        """
+        Perform speech-to-text transcription by streaming the audio file.
+
+        Unlike transcribe(), which hands the SDK a filename and lets it read
+        the whole file up front, this path feeds PCM frames through a
+        PushAudioInputStream from a background thread so the disk read
+        overlaps with the network upload. Same contract as transcribe().
+
+        Args:
+            audio_file_path (str): Path to the WAV file to transcribe
+            ori (str): Language code (e.g., 'zh-TW', 'en-US') or None for auto-detection
+            prev_text (str): Previous text to add as context vocabulary for better accuracy
+
+        Returns:
+            tuple: (transcribed_text, rtf, inference_time, detected_language)
+        """
+        start_time = time.perf_counter()
+        language = ori
+        # Map the requested language once; reused for config setup and the return value
+        mapped_language = LANGUAGE_MATCH.get(ori, ori) if ori and ori.strip() else None
+
+        try:
+            _sdk()
+            # Reuse the cached speech config for the current credentials and
+            # language (configs are immutable once cached)
+            speech_config = self._get_speech_config(mapped_language)
+
+            # Read the WAV header up front so the push stream announces the
+            # file's actual format; the SDK default (16kHz/16-bit/mono) would
+            # silently garble anything else
+            wav_file = wave.open(audio_file_path, 'rb')
+            stream_format = speechsdk.audio.AudioStreamFormat(
+                samples_per_second=wav_file.getframerate(),
+                bits_per_sample=wav_file.getsampwidth() * 8,
+                channels=wav_file.getnchannels()
+            )
+
+            # Push stream instead of a filename so we control the feed rate
+            push_stream = speechsdk.audio.PushAudioInputStream(stream_format=stream_format)
+            audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
+
+            # Create recognizer based on language specification
+            if mapped_language is None:
+                recognizer = speechsdk.SpeechRecognizer(
+                    speech_config=speech_config,
+                    auto_detect_source_language_config=self._get_auto_detect_config(),
+                    audio_config=audio_config
+                )
+            else:
+                # Language is already baked into the cached config
+                language = mapped_language
+
+                recognizer = speechsdk.SpeechRecognizer(
+                    speech_config=speech_config,
+                    audio_config=audio_config
+                )
+
+            # Apply custom vocabulary and previous text context
+            self._set_dict(prev_text, recognizer)
+
+            # Feed frames from a background thread so the SDK starts
+            # uploading while we are still reading from disk
+            def _feed_stream():
+                try:
+                    with wav_file:
+                        while True:
+                            frames = wav_file.readframes(_STREAM_CHUNK_FRAMES)
+                            if not frames:
+                                break
+                            push_stream.write(frames)
+                except Exception as e:
+                    logger.error(f" | Stream feed error: {e} | ")
+                finally:
+                    push_stream.close()
+
+            feeder = threading.Thread(target=_feed_stream, daemon=True)
+            feeder.start()
+
+            logger.info(f" | Starting streaming transcription for {audio_file_path} | ")
+
+            transcription_text, timeout_occurred = self._continuous_recognition_with_timeout(recognizer, "Transcription", is_translation=False)
+            feeder.join(timeout=1.0)
+
+            if timeout_occurred:
+                return "", 0, time.perf_counter() - start_time, "unknown"
+
+            # Process recognition results
+            if transcription_text:
+                logger.debug(" | Transcription successful: %s | ", transcription_text)
+            else:
+                logger.warning(f" | No speech could be recognized | ")
+
+            # Calculate performance metrics
+            end_time = time.perf_counter()
+            inference_time = end_time - start_time
+
+            # Calculate RTF (Real Time Factor) - use dummy result for continuous recognition
+            rtf = calculate_rtf(_DummyResult(None, transcription_text), audio_file_path, inference_time)
+
+            # Extract detected language from auto-detection results (only if auto-detection was used)
+            if mapped_language is None:
+                if transcription_text and _CJK_RE.search(transcription_text) is not None:
+                    language = "zh-TW"
+                elif transcription_text:
+                    language = "en-US"
+                else:
+                    language = "unknown"
+            else:
+                language = mapped_language
+
+            return transcription_text, rtf, inference_time, language
+
+        except Exception as e:
+            logger.error(f" | Streaming transcription error: {e} | ")
+            return "", 0, time.perf_counter() - start_time, "unknown"
 
 
     def translate(self, audio_file_path, ori, prev_text=""):
         """
         Perform speech-to-text translation from audio file to multiple target languages.
 
+        The TranslationRecognizer also produces the source-language transcription,
+        so callers that need both should use this single call rather than a
+        separate transcribe() pass — that would re-open the audio and double the
+        Azure round-trips for the same clip.
+
         Args:
             audio_file_path (str): Path to the audio file to translate
             ori (str): The source language code of the audio content
@@ -465,48 +934,25 @@ class AzureSpeechModel:
                 - rtf (float): Real Time Factor (processing_time / audio_duration)
                 - translation_time (float): Total processing time in seconds
         """  
-        start_time = time.time()  
+        start_time = time.perf_counter()  
         language = ori  
         
         try:
-            # Create translation_config dynamically for thread safety
-            translation_config = speechsdk.translation.SpeechTranslationConfig(
-                subscription=self.subscription_key,
-                region=self.service_region
-            )
-            
-            # Configure extended timeout settings for longer audio files
-            self._configure_timeout_settings(translation_config)
-            
-            # Configure custom endpoint (if available)
-            if self.endpoint_id:
-                translation_config.endpoint_id = self.endpoint_id
-                logger.debug(f" | Using custom model with endpoint_id: {self.endpoint_id} | ")
-            
-            # Create audio configuration
-            audio_config = speechsdk.audio.AudioConfig(filename=audio_file_path)
-
-            # Configure source language (must be specified for translation)
+            _sdk()
+            # Resolve the source language first (must be specified for translation)
             if language:
                 language = LANGUAGE_MATCH.get(language, language)
-                translation_config.speech_recognition_language = language
             else:
                 # Use default language if none specified
-                language = "zh-TW"  
-                translation_config.speech_recognition_language = language
+                language = "zh-TW"
                 logger.info(f" | No source language specified, using default: {language} | ")
-            
-            # Configure target languages for translation
-            for target_lang in LANGUAGE_LIST:
-                target_lang = LANGUAGE_MATCH.get(target_lang, target_lang)
-                translation_config.add_target_language(target_lang)
-                
-                # Special handling for Traditional Chinese variants
-                if target_lang in ['zh-Hant', 'zh-TW']:
-                    translation_config.set_property(
-                        property_id=speechsdk.PropertyId.SpeechServiceConnection_TranslationToLanguages,
-                        value="zh-Hant"
-                    )
+
+            # Reuse the cached translation config for this language (targets
+            # already configured; the config is immutable once cached)
+            translation_config = self._get_translation_config(language)
+
+            # Create audio configuration
+            audio_config = speechsdk.audio.AudioConfig(filename=audio_file_path)
 
             # Create translation recognizer
             recognizer = speechsdk.translation.TranslationRecognizer(
@@ -514,7 +960,7 @@ class AzureSpeechModel:
                 audio_config=audio_config
             )
 
-            logger.debug(f" | Translation recognizer created time: {time.time() - start_time:.2f} | ")
+            logger.debug(" | Translation recognizer created time: %.2f | ", time.perf_counter() - start_time)
 
             # Apply custom vocabulary and previous text context
             self._set_dict(prev_text, recognizer)
@@ -526,49 +972,95 @@ class AzureSpeechModel:
             transcription_text, raw_translations, timeout_occurred = self._continuous_recognition_with_timeout(recognizer, "Translation", is_translation=True)
             
             if timeout_occurred:
-                return "", {}, 0, time.time() - start_time
+                return "", {}, 0, time.perf_counter() - start_time
             
             # Process translation results
             translations_text = {}
             
             if transcription_text:
-                logger.debug(f" | Translation successful: {transcription_text} | ")
+                logger.debug(" | Translation successful: %s | ", transcription_text)
                 
                 # Convert raw translations to expected format
                 for target_lang, translation in raw_translations.items():
                     match_back_language = LANGUAGE_MATCH_BACK.get(target_lang, target_lang)
                     translations_text[match_back_language] = translation
-                    logger.debug(f" | {match_back_language}: {translation} | ")
+                    logger.debug(" | %s: %s | ", match_back_language, translation)
             else:
                 logger.warning(f" | No speech could be recognized for translation | ")
             
             # Calculate performance metrics
-            end_time = time.time()
+            end_time = time.perf_counter()
             translate_time = end_time - start_time
             
             # Calculate RTF (Real Time Factor) - use dummy result for continuous translation
-            # Create a mock result object for RTF calculation with proper attributes
-            dummy_result = type('Result', (), {
-                'duration': None,  # Use 'duration' instead of 'audio_duration'
-                'text': transcription_text
-            })()
-            rtf = calculate_rtf(dummy_result, audio_file_path, translate_time)
+            rtf = calculate_rtf(_DummyResult(None, transcription_text), audio_file_path, translate_time)
 
             return transcription_text, translations_text, rtf, translate_time
 
         except Exception as e:
             logger.error(f" | Translation error: {e} | ")
-            return "", {}, 0, time.time() - start_time
+            return "", {}, 0, time.perf_counter() - start_time
+
+    def warmup(self):
+        """
+        Prime the Azure Speech connection so first-call latency stays off the
+        request path.
+
+        Runs a short silence probe through a recognizer built on the cached
+        production config, establishing the TLS/WebSocket session ahead of
+        the first user-visible request. Intended to be called once at service
+        startup (after key_test has validated the credentials).
+
+        Returns:
+            bool: True if the warmup round-trip completed, False otherwise
+        """
+        start_time = time.perf_counter()
+        try:
+            _sdk()
+            # Use the cached config so the warmed-up connection state matches
+            # what real requests will use
+            speech_config = self._get_speech_config()
+
+            push_stream = speechsdk.audio.PushAudioInputStream()
+            audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
+
+            recognizer = speechsdk.SpeechRecognizer(
+                speech_config=speech_config,
+                audio_config=audio_config
+            )
+
+            # Open the connection explicitly so the TLS/WebSocket handshake
+            # happens now instead of lazily on the first audio write
+            connection = speechsdk.Connection.from_recognizer(recognizer)
+            connection.open(for_continuous_recognition=False)
+
+            # Kick off recognition and feed it the silence probe
+            result_future = recognizer.recognize_once_async()
+            push_stream.write(_SILENCE_100MS)
+            push_stream.close()
+            result_future.get()
+
+            logger.info(f" | Connection warmup completed in {time.perf_counter() - start_time:.2f} seconds | ")
+            return True
+        except Exception as e:
+            logger.warning(f" | Connection warmup failed: {e} | ")
+            return False
 
     def key_test(self, subscription_key=None, service_region=None, endpoint_id=None, name=None):
         """
         Test Azure Speech Service configuration parameters for validity.
-        
+
+        Validation is done with bounded HTTPS requests rather than a full
+        recognition round-trip, so it returns in well under a second: a token
+        request against the region's issueToken endpoint confirms the
+        subscription/region pair, and when an endpoint_id is given, a second
+        GET against the custom-model metadata endpoint confirms it exists.
+
         Args:
             subscription_key (str): Azure Speech Service subscription key
             service_region (str): Azure service region (e.g., 'eastus', 'westus2')
             endpoint_id (str, optional): Custom model endpoint ID
-            
+
         Returns:
             tuple: (is_valid, error_message)
                 - is_valid (bool): True if configuration is valid, False otherwise
@@ -579,87 +1071,71 @@ class AzureSpeechModel:
         
         if name is not None:
             config_path = f"./lib/{name}.json"
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as config_file:
-                    config = json.load(config_file)
-                subscription_key = config.get("SubscriptionKey", subscription_key)
-                service_region = config.get("ServiceRegion", service_region)
-                endpoint_id = config.get("EndpointId", endpoint_id)
-            else:
+            try:
+                # The cached loader stats the file anyway, so the existence
+                # check rides on that single syscall instead of a separate one
+                config = _load_config_cached(config_path)
+            except FileNotFoundError:
                 error_message = "The custom model config path does not exist, please check the path."
                 logger.error(f" | {error_message} | ")
                 return False, error_message
+            subscription_key = config.get("SubscriptionKey", subscription_key)
+            service_region = config.get("ServiceRegion", service_region)
+            endpoint_id = config.get("EndpointId", endpoint_id)
         
         try:
-            # Create speech_config dynamically for testing
-            speech_config = speechsdk.SpeechConfig(
-                subscription=subscription_key,
-                region=service_region
+            # A single bounded token request confirms the subscription/region
+            # pair without building a recognizer and waiting on a recognition
+            # round-trip (which blocked the caller for seconds per check)
+            response = requests.post(
+                f"https://{service_region}.api.cognitive.microsoft.com/sts/v1.0/issueToken",
+                headers={"Ocp-Apim-Subscription-Key": subscription_key},
+                timeout=3.0,
             )
-            
-            # Configure custom endpoint (if provided)
-            if endpoint_id is not None:
-                speech_config.endpoint_id = endpoint_id
-                logger.debug(f" | Testing custom model with endpoint_id: {endpoint_id} | ")
 
-            # Create a minimal audio configuration using push stream (no hardware dependency)
-            push_stream = speechsdk.audio.PushAudioInputStream()
-            audio_config = speechsdk.audio.AudioConfig(stream=push_stream)
-            
-            # Set language for testing
-            speech_config.speech_recognition_language = "en-US"
-            
-            # Set short timeout for quick validation
-            speech_config.set_property(speechsdk.PropertyId.SpeechServiceConnection_InitialSilenceTimeoutMs, "1000")
-
-            # Create recognizer to validate configuration
-            recognizer = speechsdk.SpeechRecognizer(
-                speech_config=speech_config,
-                audio_config=audio_config
-            )
-            
-            # Push a small amount of silence data to trigger connection test
-            silence_data = bytes(1600)  # 100ms of 16kHz silence
-            push_stream.write(silence_data)
-            push_stream.close()
-            
-            # Test connection with recognition attempt
-            result = recognizer.recognize_once()
-    
-            # Process test results
-            if result.reason == speechsdk.ResultReason.Canceled:
-                cancellation_details = result.cancellation_details
-                if cancellation_details.reason == speechsdk.CancellationReason.Error:
-                    error_details = cancellation_details.error_details
-                    
-                    # Specific error classification
-                    if "401" in error_details or "Unauthorized" in error_details:
-                        error_message = "Invalid subscription key"
-                    elif "404" in error_details or "Not Found" in error_details:
+            # Process probe results
+            if response.status_code == 200:
+                if endpoint_id:
+                    # Credentials are good; now confirm the custom model
+                    # endpoint actually exists so a bogus EndpointId is
+                    # rejected here instead of at the first real recognition
+                    endpoint_response = requests.get(
+                        f"https://{service_region}.api.cognitive.microsoft.com/speechtotext/v3.0/endpoints/{endpoint_id}",
+                        headers={"Ocp-Apim-Subscription-Key": subscription_key},
+                        timeout=3.0,
+                    )
+                    if endpoint_response.status_code == 200:
+                        is_valid = True
+                        logger.info(" | Configuration test successful - credentials and endpoint_id are valid | ")
+                    elif endpoint_response.status_code in (400, 404):
                         error_message = "Invalid endpoint_id or service region"
-                    elif "403" in error_details or "Forbidden" in error_details:
-                        error_message = "Access denied or quota exceeded"
-                    elif "Connection" in error_details or "timeout" in error_details.lower():
-                        error_message = "Network connection issue or invalid region"
+                    elif endpoint_response.status_code in (401, 403):
+                        error_message = "Access denied for custom model endpoint"
                     else:
-                        error_message = f"Configuration error: {error_details}"
-                    logger.error(f" | Key test failed: {error_message} | ")
+                        error_message = f"Unexpected endpoint test result: HTTP {endpoint_response.status_code}"
                 else:
-                    # Non-error cancellation (e.g., no speech detected) means config is valid
                     is_valid = True
                     logger.info(" | Configuration test successful - credentials are valid | ")
-            elif result.reason in [speechsdk.ResultReason.RecognizedSpeech, speechsdk.ResultReason.NoMatch]:
-                # Either case means the configuration worked
-                is_valid = True
-                logger.info(" | Configuration test successful - credentials are valid | ")
+            elif response.status_code == 401:
+                error_message = "Invalid subscription key"
+            elif response.status_code == 403:
+                error_message = "Access denied or quota exceeded"
+            elif response.status_code == 404:
+                error_message = "Invalid endpoint_id or service region"
             else:
-                error_message = f"Unexpected test result: {result.reason}"
-                logger.warning(f" | {error_message} | ")
-            
+                error_message = f"Unexpected test result: HTTP {response.status_code}"
+
+            if error_message:
+                logger.error(f" | Key test failed: {error_message} | ")
+
+        except requests.exceptions.RequestException:
+            # DNS failure on a bad region lands here too
+            error_message = "Network connection issue or invalid region"
+            logger.error(f" | Key test failed: {error_message} | ")
         except Exception as e:
             error_message = f"Configuration test exception: {str(e)}"
             logger.error(f" | {error_message} | ")
-            
+
         return is_valid, error_message
     
     
\ No newline at end of file
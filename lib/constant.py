@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict
 
 #############################################################################
@@ -16,7 +16,9 @@ class AudioTranslationResponse(BaseModel):
     device_id: str
     ori_lang: str
     transcription_text: str
-    text: Dict[str, str]
+    # Fresh per-instance empty result map; callers no longer need to pass
+    # DEFAULT_RESULT.copy() themselves
+    text: Dict[str, str] = Field(default_factory=lambda: dict(DEFAULT_RESULT))
     times: str
     audio_uid: str
     transcribe_time: float
@@ -26,6 +28,7 @@ class AudioTranslationResponse(BaseModel):
 
 # LANGUAGE_LIST = ['zh', 'en', 'ja', 'ko', "de", "es"]
 LANGUAGE_LIST = ['zh', 'en', 'de']
+LANGUAGE_LIST_SET = frozenset(LANGUAGE_LIST)  # O(1) membership checks on the request path
 LANGUAGE_MATCH = {"zh": "zh-TW",
                   "en": "en-US",
                   "de": "de-DE"}
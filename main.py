@@ -1,56 +1,112 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, UploadFile, File, Form
-import os  
-import time  
-import pytz  
-import logging  
-import uvicorn  
-import datetime  
-from threading import Thread, Event  
-from api.azure_speech import AzureSpeechModel  
+from fastapi.responses import ORJSONResponse
+import os
+import re
+import json
+import time
+import queue
+import atexit
+import asyncio
+import tempfile
+import shutil
+import logging
+import logging.handlers
+import uvicorn
+import datetime
+from threading import Event, Lock
+from zoneinfo import ZoneInfo
+from starlette.concurrency import run_in_threadpool
+from api.azure_speech import AzureSpeechModel, configure_logging
 from lib.base_object import BaseResponse, Status
-from lib.constant import AudioTranslationResponse, LANGUAGE_LIST, DEFAULT_RESULT
+from pydantic import TypeAdapter
+from lib.constant import AudioTranslationResponse, LANGUAGE_LIST, LANGUAGE_LIST_SET
 from api.utils import write_txt
 
-if not os.path.exists("./audio"):  
-    os.mkdir("./audio")  
-if not os.path.exists("./logs"):  
-    os.mkdir("./logs")  
+# Per-request audio buffers land here; point AUDIO_BUFFER_DIR at a tmpfs
+# mount (e.g. /dev/shm/babelon) to take the writes off disk entirely
+AUDIO_BUFFER_DIR = os.environ.get("AUDIO_BUFFER_DIR", "./audio")
+
+os.makedirs(AUDIO_BUFFER_DIR, exist_ok=True)
+if not os.path.exists("./logs"):
+    os.mkdir("./logs")
     
-# Configure logging  
-log_format = "%(asctime)s - %(message)s"  # Output timestamp and message content  
-log_file = "logs/app.log"  
-logging.basicConfig(level=logging.INFO, format=log_format)  
-  
-# Create a file handler  
-file_handler = logging.handlers.RotatingFileHandler(  
-    log_file, maxBytes=10*1024*1024, backupCount=5  
-)  
-file_handler.setFormatter(logging.Formatter(log_format))  
-  
-# Create a console handler  
-console_handler = logging.StreamHandler()  
-console_handler.setFormatter(logging.Formatter(log_format))  
-  
-logger = logging.getLogger(__name__)  
-logger.setLevel(logging.INFO)  # Ensure logger level is set to INFO or lower  
-  
-# Clear existing handlers to prevent duplicate logs  
-if not logger.handlers:  
-    logger.addHandler(file_handler)  
-    logger.addHandler(console_handler)  # Add console handler 
+# Configure logging
+log_format = "%(asctime)s - %(message)s"  # Output timestamp and message content
+log_file = "logs/app.log"
+logging.basicConfig(level=logging.INFO, format=log_format)
 
-logger.propagate = False  
-  
-# Configure UTC+8 time  
-utc_now = datetime.datetime.now(pytz.utc)  
-tz = pytz.timezone('Asia/Taipei')  
-local_now = utc_now.astimezone(tz)  
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)  # Ensure logger level is set to INFO or lower
+
+# Guard against duplicate handlers on re-import
+if not logger.handlers:
+    # The file and console handlers do blocking I/O, so they run on a
+    # QueueListener thread; request threads only enqueue records
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=10*1024*1024, backupCount=5
+    )
+    file_handler.setFormatter(logging.Formatter(log_format))
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(log_format))
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    log_listener.start()
+    atexit.register(log_listener.stop)
+
+logger.propagate = False
+
+# Install the api-module log handlers here (no longer an import side effect)
+configure_logging()
+
+# Configure UTC+8 time; ZoneInfo instances are cached by the stdlib and
+# shared here so no request or scheduler pass rebuilds them
+UTC = datetime.timezone.utc
+TPE_TZ = ZoneInfo('Asia/Taipei')
   
-model = AzureSpeechModel()  
+# Serializer built once at import; dump_json reuses the compiled schema
+# instead of re-deriving it per call
+translation_response_adapter = TypeAdapter(AudioTranslationResponse)
+
+# Splits a prompt on commas and trims surrounding whitespace in one pass
+PROMPT_SPLIT_RE = re.compile(r'\s*,\s*')
+
+model = AzureSpeechModel()
 waiting_list = []
 sse_stop_event = Event()  # Global event to control SSE connection
-service_stop_event = Event()  
+
+# Cached ./lib directory listing; rebuilt only after a config is added or removed
+available_models_cache = None
+available_models_lock = Lock()
+
+def get_available_models():
+    """
+    Return the cached list of model config names, scanning ./lib on a miss.
+    """
+    global available_models_cache
+    with available_models_lock:
+        if available_models_cache is None:
+            with os.scandir("./lib") as entries:
+                available_models_cache = [
+                    entry.name[:-len(".json")]
+                    for entry in entries
+                    if entry.is_file() and entry.name.endswith(".json")
+                ]
+        return available_models_cache
+
+def invalidate_available_models():
+    """
+    Drop the cached model list so the next lookup rescans the directory.
+    """
+    global available_models_cache
+    with available_models_lock:
+        available_models_cache = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -82,17 +138,20 @@ async def lifespan(app: FastAPI):
         
         logger.info(f" | Azure Speech Model initialized successfully | ")
         logger.info(f" | Model: {model.model_version} | Region: {model.service_region} | ")
-        
-        # Clean up old audio files
-        logger.info(f" | Cleaning up old audio files... | ")
-        delete_old_audio_files()
-        
-        # Start daily task scheduling  
+
+        # Pre-warm the Azure connection so the first request skips setup cost
+        logger.info(f" | Warming up Azure Speech connection... | ")
+        model.warmup()
+
+        # Kick off the initial cleanup in the background; startup should not
+        # wait on a directory sweep (the frame holds the reference until shutdown)
+        logger.info(f" | Scheduling cleanup of old audio files... | ")
+        cleanup_task = asyncio.create_task(asyncio.to_thread(delete_old_audio_files))
+
+        # Start daily task scheduling on the event loop
         logger.info(f" | Starting background task scheduler... | ")
-        task_thread = Thread(target=schedule_daily_task, args=(service_stop_event,))  
-        task_thread.daemon = True  # Make it a daemon thread for proper cleanup
-        task_thread.start()
-        
+        scheduler_task = asyncio.create_task(schedule_daily_task_async())
+
         logger.info(f" | ##################################################### | ")  
         logger.info(f" | Azure Speech Babelon Service Started Successfully! | ")
         logger.info(f" | ##################################################### | ")  
@@ -109,16 +168,12 @@ async def lifespan(app: FastAPI):
     logger.info(f" | ##################################################### | ")  
     
     try:
-        # Stop background tasks
+        # Stop background tasks; cancellation lands at the scheduler's await
+        # immediately, no polling or join timeout needed
         logger.info(f" | Stopping background tasks... | ")
-        service_stop_event.set()  
-        
-        # Wait for background thread to finish (with timeout)
-        if task_thread.is_alive():
-            task_thread.join(timeout=5.0)  # 5 second timeout
-            if task_thread.is_alive():
-                logger.warning(f" | Background task did not stop gracefully | ")
-        
+        scheduler_task.cancel()
+        await asyncio.gather(scheduler_task, return_exceptions=True)
+
         # Stop any running SSE connections
         logger.info(f" | Stopping SSE connections... | ")
         sse_stop_event.set()
@@ -139,7 +194,8 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f" | Error during shutdown: {e} | ")
 
-app = FastAPI(lifespan=lifespan)
+# orjson serializes responses several times faster than the stdlib encoder
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 ##############################################################################  
 
@@ -160,11 +216,9 @@ async def set_prompt(prompt = Form(None)):
         logger.info(f" | Dictionary has been cleared. | ")
         return BaseResponse(message=" | Dictionary has been cleared. | ", data=[])
 
-    # Split by comma and clean up each word
-    words = [word.strip() for word in prompt.split(',')]
-    # Remove empty strings
-    words = [word for word in words if word]
-    
+    # Split on commas and strip whitespace in a single regex pass
+    words = [word for word in PROMPT_SPLIT_RE.split(prompt.strip()) if word]
+
     logger.info(f" | Input dictionary string: {prompt} | ")
     logger.info(f" | Processed dictionary list: {words} | ")
     
@@ -179,8 +233,7 @@ async def check_available_models():
     """
     Check available models.
     """
-    available_models = os.listdir("./lib")
-    available_models = [model_name.replace(".json", "") for model_name in available_models if model_name.endswith(".json")]
+    available_models = get_available_models()
     logger.info(f" | Available models: {available_models} | ")
     return BaseResponse(message=f" | Available models retrieved successfully. | '{available_models}' | ", data=available_models)
 
@@ -226,10 +279,18 @@ async def upload_custom_model(name: str = Form(...),
     
     if valid:
         config_path = f"./lib/{name}.json"
-        if EndpointId is None:
-            open(config_path, 'w').write(f'{{"name": "{name}", \n"SubscriptionKey": "{SubscriptionKey}", \n"ServiceRegion": "{ServiceRegion}"}}')
-        else:
-            open(config_path, 'w').write(f'{{"name": "{name}", \n"SubscriptionKey": "{SubscriptionKey}", \n"ServiceRegion": "{ServiceRegion}", \n"EndpointId": "{EndpointId}"}}')
+        config = {"name": name, "SubscriptionKey": SubscriptionKey, "ServiceRegion": ServiceRegion}
+        if EndpointId is not None:
+            config["EndpointId"] = EndpointId
+
+        # Write to a temp file in the same directory and atomically swap it in,
+        # so a crash mid-write can never leave a truncated config behind
+        with tempfile.NamedTemporaryFile('w', dir="./lib", suffix=".json.tmp", delete=False) as f:
+            json.dump(config, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f.name, config_path)
+        invalidate_available_models()
         return BaseResponse(message=f" | Custom model config saved successfully. | ", data=None)
     else:
         return BaseResponse(status=Status.FAILED, message=f" | Upload failed | {message} | ", data=None)
@@ -354,49 +415,79 @@ async def translate(
         meeting_id=meeting_id,  
         device_id=device_id,  
         ori_lang=o_lang,  
-        transcription_text="",  
-        text=DEFAULT_RESULT.copy(),  
-        times=str(times),  
+        transcription_text="",
+        times=str(times),
         audio_uid=audio_uid,  
         transcribe_time=0.0,  
         translate_time=0.0,  
     )  
   
-    # Save the uploaded audio file  
-    file_name = times + ".wav"  
-    audio_buffer = f"audio/{file_name}"  
-    with open(audio_buffer, 'wb') as f:  
-        f.write(file.file.read())  
-  
-    # Check if the audio file exists  
-    if not os.path.exists(audio_buffer):  
-        return BaseResponse(status=Status.FAILED, message=" | The audio file does not exist, please check the audio path. | ", data=response_data)  
-  
-    # Check if the model has been loaded  
+    # Save the uploaded audio file
+    file_name = times + ".wav"
+    audio_buffer = os.path.join(AUDIO_BUFFER_DIR, file_name)
+
+    def save_upload():
+        # Spooled uploads that rolled over to a real file can be copied
+        # in-kernel without moving the bytes through userspace. Checking
+        # _rolled first avoids forcing small in-memory spools onto disk
+        # just to get a file descriptor.
+        src_fd = None
+        if getattr(file.file, "_rolled", True):
+            try:
+                src_fd = file.file.fileno()
+            except (OSError, AttributeError):
+                src_fd = None
+
+        with open(audio_buffer, 'wb') as f:
+            if src_fd is not None and hasattr(os, 'copy_file_range'):
+                try:
+                    os.lseek(src_fd, 0, os.SEEK_SET)
+                    while os.copy_file_range(src_fd, f.fileno(), 1 << 20) > 0:
+                        pass
+                    return
+                except OSError:
+                    # Kernel/filesystem combination doesn't support it;
+                    # start over with the userspace copy
+                    f.seek(0)
+                    f.truncate()
+            file.file.seek(0)
+            # Stream in 1MB chunks instead of buffering the whole file in memory
+            shutil.copyfileobj(file.file, f, length=1 << 20)
+
+    # Blocking disk write runs on the threadpool, not the event loop; a
+    # failed write raises here, so no exists() re-check is needed
+    await run_in_threadpool(save_upload)
+
+    # Check if the model has been loaded
     if model.model_version is None:  
         return BaseResponse(status=Status.FAILED, message=" | model haven't been load successfully. may out of memory please check again | ", data=response_data)  
   
     try:  
         if use_translate:
             # main transcription process
-            if o_lang not in LANGUAGE_LIST:  
+            if o_lang not in LANGUAGE_LIST_SET:
                 logger.info(f" | The original language is not in LANGUAGE_LIST: {LANGUAGE_LIST}. | ")  
                 return BaseResponse(status=Status.FAILED, message=f" | The original language is not in LANGUAGE_LIST: {LANGUAGE_LIST}. | ", data=response_data) 
             
-            transcription_text, translated_text, rtf, translate_time = model.translate(audio_buffer, o_lang, prev_text=prev_text)    
+            # Recognition blocks on the Azure round-trip; keep it off the event loop
+            transcription_text, translated_text, rtf, translate_time = await asyncio.to_thread(
+                model.translate, audio_buffer, o_lang, prev_text=prev_text)
         else:
             # main translation process
-            if o_lang not in LANGUAGE_LIST and o_lang is not None and o_lang != "":  
+            if o_lang not in LANGUAGE_LIST_SET and o_lang is not None and o_lang != "":
                 o_lang = None
             
-            transcription_text, rtf, transcription_time, language = model.transcribe(audio_buffer, o_lang, prev_text=prev_text)
+            transcription_text, rtf, transcription_time, language = await asyncio.to_thread(
+                model.transcribe, audio_buffer, o_lang, prev_text=prev_text)
     except Exception as e:  
         logger.error(f" | translation() error: {e} | ")  
         return BaseResponse(status=Status.FAILED, message=f" | translation() error: {e} | ", data=response_data)
 
-    # Remove the audio buffer file  
-    if os.path.exists(audio_buffer):
-        os.remove(audio_buffer)  
+    # Remove the audio buffer file (EAFP: one syscall instead of stat+remove)
+    try:
+        os.unlink(audio_buffer)
+    except FileNotFoundError:
+        pass
 
     response_data.transcription_text = transcription_text
     if use_translate:
@@ -411,7 +502,9 @@ async def translate(
         response_data.transcribe_time = transcription_time
         zh_result = en_result = de_result = ""
 
-    logger.debug(response_data.model_dump_json())
+    # Serialization is expensive; only run it when debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(translation_response_adapter.dump_json(response_data).decode())
     logger.info(f" | device_id: {response_data.device_id} | audio_uid: {response_data.audio_uid} | source language: {o_lang} | time: {times} | ")
     logger.info(f" | Transcription: {transcription_text} | ")
     if use_translate:
@@ -447,77 +540,72 @@ def delete_old_audio_files():
     ----------  
     Deleted old files  
     """  
-    current_time = time.time()  
-    audio_dir = "./audio"  
-    for filename in os.listdir(audio_dir):  
-        if filename == "test.wav":  # Skip specific file  
-            continue  
-        file_path = os.path.join(audio_dir, filename)  
-        if os.path.isfile(file_path):  
-            file_creation_time = os.path.getctime(file_path)  
-            # Delete files older than a day  
-            if current_time - file_creation_time > 24 * 60 * 60:  
-                os.remove(file_path)  
-                logger.info(f" | Deleted old file: {file_path} | ")  
-                
-    config_path = "./lib"
-    for filename in os.listdir(config_path):
-        if filename.endswith(".json"):
-            file_path = os.path.join(config_path, filename)  
-            if os.path.isfile(file_path):  
-                file_creation_time = os.path.getctime(file_path)  
-                # Delete files older than 30 days  
-                if current_time - file_creation_time > 30 * 24 * 60 * 60:  
-                    os.remove(file_path)  
-                    logger.info(f" | Deleted old config: {file_path} | ")
+    current_time = time.time()
+    # scandir returns cached stat info with each entry, so the type check and
+    # timestamp need no extra stat() calls per file
+    with os.scandir(AUDIO_BUFFER_DIR) as entries:
+        for entry in entries:
+            if entry.name == "test.wav":  # Skip specific file
+                continue
+            if entry.is_file():
+                file_creation_time = entry.stat().st_ctime
+                # Delete files older than a day
+                if current_time - file_creation_time > 24 * 60 * 60:
+                    os.remove(entry.path)
+                    logger.info(f" | Deleted old file: {entry.path} | ")
+
+    with os.scandir("./lib") as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                file_creation_time = entry.stat().st_ctime
+                # Delete files older than 30 days
+                if current_time - file_creation_time > 30 * 24 * 60 * 60:
+                    os.remove(entry.path)
+                    logger.info(f" | Deleted old config: {entry.path} | ")
+                    invalidate_available_models()
 
 # Daily task scheduling  
-def schedule_daily_task(stop_event):  
+async def schedule_daily_task_async():
     """
-    Background task that runs daily cleanup operations.
+    Background task that runs daily cleanup operations at local midnight.
+
+    Runs as an asyncio task on the main event loop; shutdown cancels it
+    rather than signalling an event, so no dedicated thread is needed.
     """
     logger.info(f" | Daily task scheduler started | ")
-    last_cleanup_day = None
-    
-    while not stop_event.is_set():  
-        try:
-            # Get current time in local timezone
-            utc_now = datetime.datetime.now(pytz.utc)  
-            tz = pytz.timezone('Asia/Taipei')  
-            current_local_time = utc_now.astimezone(tz)
-            current_day = current_local_time.date()
-            
-            # Check if it's midnight (00:00-00:01) and we haven't cleaned today
-            if (current_local_time.hour == 0 and 
-                current_local_time.minute == 0 and 
-                last_cleanup_day != current_day):
-                
+    try:
+        while True:
+            try:
+                # Sleep straight through to the next local midnight instead of
+                # polling the clock
+                now = datetime.datetime.now(UTC).astimezone(TPE_TZ)
+                next_midnight = (now + datetime.timedelta(days=1)).replace(
+                    hour=0, minute=0, second=0, microsecond=0)
+                await asyncio.sleep((next_midnight - now).total_seconds())
+
                 logger.info(f" | Running daily cleanup task... | ")
-                delete_old_audio_files()  
-                last_cleanup_day = current_day
+                # The sweep does blocking filesystem work; keep it off the loop
+                await asyncio.to_thread(delete_old_audio_files)
                 logger.info(f" | Daily cleanup completed | ")
-                
-                # Sleep for 60 seconds to prevent multiple triggers
-                if not stop_event.wait(60):
-                    continue
-                    
-            # Check every 30 seconds
-            if stop_event.wait(30):
-                break
-                
-        except Exception as e:
-            logger.error(f" | Error in daily task scheduler: {e} | ")
-            # Wait a bit before retrying
-            if stop_event.wait(60):
-                break
-    
-    logger.info(f" | Daily task scheduler stopped | ")  
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f" | Error in daily task scheduler: {e} | ")
+                # Wait a bit before retrying
+                await asyncio.sleep(60)
+    finally:
+        logger.info(f" | Daily task scheduler stopped | ")
   
-if __name__ == "__main__":  
-    port = int(os.environ.get("PORT", 80))  
-    uvicorn.config.LOGGING_CONFIG["formatters"]["default"]["fmt"] = "%(asctime)s [%(name)s] %(levelprefix)s %(message)s"  
-    uvicorn.config.LOGGING_CONFIG["formatters"]["access"]["fmt"] = '%(asctime)s [%(name)s] %(levelprefix)s %(client_addr)s - "%(request_line)s" %(status_code)s'  
-    uvicorn.run(app, log_level='info', host='0.0.0.0', port=port)   
+if __name__ == "__main__":
+    port = int(os.environ.get("PORT", 80))
+    workers = int(os.environ.get("WORKERS", 1))
+    uvicorn.config.LOGGING_CONFIG["formatters"]["default"]["fmt"] = "%(asctime)s [%(name)s] %(levelprefix)s %(message)s"
+    uvicorn.config.LOGGING_CONFIG["formatters"]["access"]["fmt"] = '%(asctime)s [%(name)s] %(levelprefix)s %(client_addr)s - "%(request_line)s" %(status_code)s'
+    # uvloop + httptools cut per-request event loop and parsing overhead;
+    # multiple workers need the app as an import string
+    uvicorn.run("main:app" if workers > 1 else app, log_level='info', host='0.0.0.0', port=port,
+                loop='uvloop', http='httptools', workers=workers)
     
     
  
\ No newline at end of file